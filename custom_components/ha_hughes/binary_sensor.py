@@ -13,8 +13,8 @@ Reference: Android HughesWatchdogDevicePlugin.kt / HughesGen2GattCallback diag p
 
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
+from operator import attrgetter
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -28,7 +28,14 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEVICE_NAME, DOMAIN
+from .const import (
+    AVAIL_BASIC,
+    AVAIL_CONNECTED,
+    AVAIL_DUAL_LINE,
+    AVAIL_ENHANCED,
+    CONF_DEVICE_NAME,
+    DOMAIN,
+)
 from .coordinator import HughesCoordinator
 from .models import HughesState
 from .sensor import _make_device_info
@@ -38,9 +45,11 @@ from .sensor import _make_device_info
 class HughesBinarySensorDescription(BinarySensorEntityDescription):
     """Describe a Hughes binary sensor entity."""
 
-    value_fn: Callable[[HughesCoordinator], bool | None]
+    attr: str                    # attribute read by this entity
+    per_line: bool = False       # True if attr is on line data, not the coordinator
+    invert: bool = False
     gen2_enhanced_only: bool = False
-    is_l2: bool = False
+    is_l2: bool = False          # True if this entity reads from line2
 
 
 BINARY_SENSOR_DESCRIPTIONS: tuple[HughesBinarySensorDescription, ...] = (
@@ -49,7 +58,7 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[HughesBinarySensorDescription, ...] = (
         name="Connected",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        value_fn=lambda c: c.connected,
+        attr="connected",
     ),
     HughesBinarySensorDescription(
         key="data_healthy",
@@ -58,7 +67,8 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[HughesBinarySensorDescription, ...] = (
         device_class=BinarySensorDeviceClass.PROBLEM,
         icon="mdi:heart-pulse",
         # PROBLEM class: ON = problem, so invert
-        value_fn=lambda c: not c.data_healthy,
+        attr="data_healthy",
+        invert=True,
     ),
     # Gen2 enhanced: boost active
     HughesBinarySensorDescription(
@@ -67,9 +77,8 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[HughesBinarySensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:flash-triangle",
         gen2_enhanced_only=True,
-        value_fn=lambda c: (
-            c.state.line1.boost if c.state is not None else None
-        ),
+        per_line=True,
+        attr="boost",
     ),
     HughesBinarySensorDescription(
         key="boost_l2",
@@ -78,9 +87,8 @@ BINARY_SENSOR_DESCRIPTIONS: tuple[HughesBinarySensorDescription, ...] = (
         icon="mdi:flash-triangle",
         gen2_enhanced_only=True,
         is_l2=True,
-        value_fn=lambda c: (
-            c.state.line2.boost if c.state is not None and c.state.line2 is not None else None
-        ),
+        per_line=True,
+        attr="boost",
     ),
 )
 
@@ -92,11 +100,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hughes binary sensor entities from a config entry."""
     coordinator: HughesCoordinator = hass.data[DOMAIN][entry.entry_id]
-    address = entry.data[CONF_ADDRESS]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "")
+    device_info = _make_device_info(
+        entry.data[CONF_ADDRESS], entry.data.get(CONF_DEVICE_NAME, "")
+    )
 
     async_add_entities(
-        HughesBinarySensor(coordinator, address, device_name, desc)
+        HughesBinarySensor(coordinator, device_info, desc)
         for desc in BINARY_SENSOR_DESCRIPTIONS
         if not desc.gen2_enhanced_only or coordinator.is_enhanced
     )
@@ -111,30 +120,40 @@ class HughesBinarySensor(CoordinatorEntity[HughesCoordinator], BinarySensorEntit
     def __init__(
         self,
         coordinator: HughesCoordinator,
-        address: str,
-        device_name: str,
+        device_info: DeviceInfo,
         description: HughesBinarySensorDescription,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_{description.key}"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + description.key
+        self._attr_device_info = device_info
+        self._getter = attrgetter(description.attr)
+        required = AVAIL_CONNECTED
+        if description.gen2_enhanced_only:
+            required = AVAIL_BASIC | AVAIL_ENHANCED
+            if description.is_l2:
+                required |= AVAIL_DUAL_LINE
+        self._required = required
 
     @property
     def available(self) -> bool:
         """Available when connected (and optionally when enhanced/dual-line confirmed)."""
-        if not self.coordinator.connected:
-            return False
-        if self.entity_description.gen2_enhanced_only:
-            state = self.coordinator.state
-            if state is None or not state.is_enhanced:
-                return False
-            if self.entity_description.is_l2 and not state.is_dual_line:
-                return False
-        return True
+        return (self.coordinator.availability & self._required) == self._required
 
     @property
     def is_on(self) -> bool | None:
         """Return the binary sensor state."""
-        return self.entity_description.value_fn(self.coordinator)
+        description = self.entity_description
+        if description.per_line:
+            state = self.coordinator.state
+            if state is None:
+                return None
+            line = state.line2 if description.is_l2 else state.line1
+            if line is None:
+                return None
+            value = self._getter(line)
+        else:
+            value = self._getter(self.coordinator)
+        if value is None or not description.invert:
+            return value
+        return not value
@@ -15,6 +15,7 @@ from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -32,12 +33,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hughes button entities from a config entry."""
     coordinator: HughesCoordinator = hass.data[DOMAIN][entry.entry_id]
-    address = entry.data[CONF_ADDRESS]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "")
+    device_info = _make_device_info(
+        entry.data[CONF_ADDRESS], entry.data.get(CONF_DEVICE_NAME, "")
+    )
 
     async_add_entities([
-        HughesResetEnergyButton(coordinator, address, device_name),
-        HughesSyncTimeButton(coordinator, address, device_name),
+        HughesResetEnergyButton(coordinator, device_info),
+        HughesSyncTimeButton(coordinator, device_info),
     ])
 
 
@@ -54,12 +56,11 @@ class HughesResetEnergyButton(CoordinatorEntity[HughesCoordinator], ButtonEntity
     _attr_icon = "mdi:counter"
 
     def __init__(
-        self, coordinator: HughesCoordinator, address: str, device_name: str
+        self, coordinator: HughesCoordinator, device_info: DeviceInfo
     ) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_reset_energy"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + "reset_energy"
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
@@ -84,12 +85,11 @@ class HughesSyncTimeButton(CoordinatorEntity[HughesCoordinator], ButtonEntity):
     _attr_icon = "mdi:clock-sync"
 
     def __init__(
-        self, coordinator: HughesCoordinator, address: str, device_name: str
+        self, coordinator: HughesCoordinator, device_info: DeviceInfo
     ) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_sync_time"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + "sync_time"
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
@@ -18,6 +18,7 @@ import voluptuous as vol
 from homeassistant.components.bluetooth import (
     BluetoothServiceInfoBleak,
     async_discovered_service_info,
+    async_last_service_info,
 )
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_ADDRESS
@@ -35,23 +36,52 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on devices offered in the user-step picker, so a crowded RV park
+# can't balloon the vol.In() schema. The first devices discovered are kept and
+# the rest are ignored.
+_MAX_DISCOVERED_DEVICES = 64
+
+# Normalised match tables, built once at import. _is_hughes_device runs for
+# every advertisement seen while the flow is open, so keep the per-call work to
+# plain startswith / set membership.
+_GEN1_PREFIXES_UPPER: tuple[str, ...] = tuple(p.upper() for p in GEN1_NAME_PREFIXES)
+_GEN2_PREFIX_UPPER: str = GEN2_NAME_PREFIX.upper()
+_ALL_SERVICE_UUIDS_LOWER: frozenset[str] = frozenset(u.lower() for u in ALL_SERVICE_UUIDS)
+# First characters of every known prefix (either case). Most advertisers nearby
+# are unrelated, and this rejects them before the name is upper-cased.
+_NAME_FIRST_CHARS: frozenset[str] = frozenset(
+    c
+    for p in (*_GEN1_PREFIXES_UPPER, _GEN2_PREFIX_UPPER)
+    for c in (p[0], p[0].lower())
+)
+
 
 def _detect_generation(name: str) -> str:
     """Determine generation from device name. Defaults to GEN1 for unknown names."""
-    if name.upper().startswith(GEN2_NAME_PREFIX.upper()):
+    if name.upper().startswith(_GEN2_PREFIX_UPPER):
         return GEN2
     return GEN1
 
 
+def _has_hughes_service(info: BluetoothServiceInfoBleak) -> bool:
+    """Return True if the advertisement lists a Gen1 or Gen2 service UUID."""
+    for uuid in info.service_uuids:
+        if uuid.lower() in _ALL_SERVICE_UUIDS_LOWER:
+            return True
+    return False
+
+
 def _is_hughes_device(info: BluetoothServiceInfoBleak) -> bool:
     """Return True if this BLE advertisement looks like a Hughes Power Watchdog."""
-    name = (info.name or "").upper()
-    if any(name.startswith(p.upper()) for p in GEN1_NAME_PREFIXES):
-        return True
-    if name.startswith(GEN2_NAME_PREFIX.upper()):
-        return True
-    uuids_lower = [u.lower() for u in info.service_uuids]
-    return any(u.lower() in uuids_lower for u in ALL_SERVICE_UUIDS)
+    name = info.name
+    if name and name[0] in _NAME_FIRST_CHARS:
+        name = name.upper()
+        if name.startswith(_GEN1_PREFIXES_UPPER):
+            return True
+        if name.startswith(_GEN2_PREFIX_UPPER):
+            return True
+    # Fallback: nameless or renamed units that still advertise a Hughes service.
+    return _has_hughes_service(info)
 
 
 class HughesConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -132,12 +162,13 @@ class HughesConfigFlow(ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(address)
             self._abort_if_unique_id_configured()
 
-            # Check if this address is in recently discovered devices
-            device_name = ""
-            for info in async_discovered_service_info(self.hass):
-                if info.address.upper() == address.upper():
-                    device_name = info.name or ""
-                    break
+            # Check if this address is in recently discovered devices. The
+            # scanner cache is keyed by address, so this is a direct lookup.
+            lookup = address.upper()
+            info = async_last_service_info(
+                self.hass, lookup, connectable=True
+            ) or async_last_service_info(self.hass, lookup, connectable=False)
+            device_name = (info.name or "") if info is not None else ""
 
             generation = _detect_generation(device_name)
 
@@ -151,12 +182,14 @@ class HughesConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
         # Populate discovered devices list for user selection
-        self._discovered_devices = {}
+        seen: dict[str, BluetoothServiceInfoBleak] = {}
         for info in async_discovered_service_info(self.hass):
-            if info.address in self._discovered_devices:
+            if not _is_hughes_device(info):
                 continue
-            if _is_hughes_device(info):
-                self._discovered_devices[info.address] = info
+            seen.setdefault(info.address, info)
+            if len(seen) >= _MAX_DISCOVERED_DEVICES:
+                break
+        self._discovered_devices = seen
 
         if self._discovered_devices:
             addresses = {
@@ -2,6 +2,16 @@
 
 DOMAIN = "ha_hughes"
 
+
+def _error_table(known: dict[int, str]) -> tuple[str, ...]:
+    """Return the text for every possible error byte, indexed by code.
+
+    Error codes are unpacked as an unsigned byte, so any value 0-255 indexes the
+    table directly; codes without a known meaning get a prebuilt "Unknown (n)".
+    """
+    return tuple(known.get(code, f"Unknown ({code})") for code in range(256))
+
+
 # ---------------------------------------------------------------------------
 # Config entry data keys
 # ---------------------------------------------------------------------------
@@ -72,6 +82,7 @@ GEN1_ERROR_CODES: dict[int, str] = {
     8: "Lost Ground",
     9: "No RV Neutral",
 }
+GEN1_ERROR_TEXTS = _error_table(GEN1_ERROR_CODES)
 
 # ---------------------------------------------------------------------------
 # Gen2 protocol constants
@@ -148,6 +159,7 @@ GEN2_ERROR_CODES: dict[int, str] = {
     13: "F3",
     14: "F4",
 }
+GEN2_ERROR_TEXTS = _error_table(GEN2_ERROR_CODES)
 
 # ---------------------------------------------------------------------------
 # Timing (seconds)
@@ -161,3 +173,14 @@ RECONNECT_BACKOFF_BASE = 5.0
 RECONNECT_BACKOFF_CAP = 120.0
 STALE_TIMEOUT = 300.0          # 5 min without data → force reconnect
 WATCHDOG_INTERVAL = 60.0       # health-check interval
+STATE_PUSH_COOLDOWN = 0.05     # coalesce entity updates arriving within 50 ms
+
+# ---------------------------------------------------------------------------
+# Entity availability bits (HughesCoordinator.availability)
+# ---------------------------------------------------------------------------
+AVAIL_CONNECTED = 1 << 0   # BLE link is up
+AVAIL_STATE = 1 << 1       # at least one report parsed
+AVAIL_ENHANCED = 1 << 2    # model reports output voltage / boost / temperature
+AVAIL_DUAL_LINE = 1 << 3   # line 2 is reporting
+
+AVAIL_BASIC = AVAIL_CONNECTED | AVAIL_STATE
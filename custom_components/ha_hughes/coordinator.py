@@ -35,19 +35,25 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
+from collections.abc import Callable
 from typing import Any
 
 from bleak import BleakClient, BleakError, BleakGATTCharacteristic
+from bleak.backends.service import BleakGATTService
 from bleak_retry_connector import establish_connection
 
 from homeassistant.components import bluetooth
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import (
+    AVAIL_CONNECTED,
+    AVAIL_DUAL_LINE,
+    AVAIL_ENHANCED,
+    AVAIL_STATE,
     CONF_DEVICE_NAME,
     CONF_GENERATION,
     DOMAIN,
@@ -60,6 +66,7 @@ from .const import (
     GEN2_INIT_SETTLE_DELAY,
     GEN2_INIT_TIMEOUT,
     GEN2_NAME_PREFIX,
+    GEN2_PROTOCOL_OK_RESPONSE,
     GEN2_PROTOCOL_OPEN_CMD,
     GEN2_RW_CHAR_UUID,
     GEN2_SERVICE_UUID,
@@ -68,6 +75,7 @@ from .const import (
     RECONNECT_BACKOFF_CAP,
     SERVICE_DISCOVERY_DELAY,
     STALE_TIMEOUT,
+    STATE_PUSH_COOLDOWN,
     WATCHDOG_INTERVAL,
 )
 from .models import HughesLineData, HughesState
@@ -76,11 +84,29 @@ from .protocol.gen2 import Gen2CommandBuilder, Gen2PacketFramer, parse_dl_report
 
 _LOGGER = logging.getLogger(__name__)
 
+# Bleak reports characteristic UUIDs in lower-case 128-bit form; normalise ours
+# once so connect-time lookups are plain string compares.
+_GEN1_NOTIFY_CHAR_UUID_LOWER = GEN1_NOTIFY_CHAR_UUID.lower()
+_GEN2_RW_CHAR_UUID_LOWER = GEN2_RW_CHAR_UUID.lower()
+
+
+def _find_characteristic(
+    svc: BleakGATTService, uuid_lower: str
+) -> BleakGATTCharacteristic | None:
+    """Return the characteristic of svc matching a lower-case UUID, or None."""
+    for char in svc.characteristics:
+        if char.uuid == uuid_lower:
+            return char
+    return None
+
 
 def _detect_enhanced(device_name: str) -> bool:
     """Return True if the Gen2 device name indicates an enhanced model (E8/V8/E9/V9)."""
-    parts = device_name.upper().split("_")
-    return len(parts) >= 2 and parts[1] in GEN2_ENHANCED_MODELS
+    # Model is the segment after the first underscore, e.g. "WD_E8_1234" → "E8".
+    _, sep, rest = device_name.upper().partition("_")
+    if not sep:
+        return False
+    return rest.partition("_")[0] in GEN2_ENHANCED_MODELS
 
 
 class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
@@ -93,6 +119,8 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
             name=f"Hughes {entry.data[CONF_ADDRESS]}",
         )
         self._address: str = entry.data[CONF_ADDRESS]
+        # "<lower-case MAC without separators>_", prepended to every entity unique_id
+        self._uid_prefix: str = self._address.replace(":", "").lower() + "_"
         self._generation: str = entry.data.get(CONF_GENERATION, GEN1)
         self._device_name: str = entry.data.get(CONF_DEVICE_NAME, "")
         self._entry = entry
@@ -103,6 +131,10 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         )
         self._is_dual_line: bool = False
 
+        # AVAIL_* bitmask, recomputed by _refresh_availability whenever listeners
+        # are notified; each entity tests it against its own required bits
+        self._availability = 0
+
         # BLE client
         self._client: BleakClient | None = None
         self._connected = False
@@ -112,18 +144,35 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         self._gen1_assembler: Gen1FrameAssembler | None = None
         self._gen2_framer: Gen2PacketFramer | None = None
         self._gen2_builder: Gen2CommandBuilder | None = None
+        # Gen2 command code → body handler, populated by _init_gen2
+        self._cmd_handlers: dict[int, Callable[[bytes], None]] = {}
 
         # State
         self.state: HughesState | None = None
         self._first_data_received = False
+        # Gen2: True until the "ok" open ack or the first framed packet arrives
+        self._awaiting_ok = True
 
-        # Health / timing
+        # Health / timing. Timestamps come from loop.time(), which still calls
+        # time.monotonic() underneath; using it keeps every timestamp in the
+        # same clock domain as the loop's scheduled callbacks, it is not cheaper.
+        self._loop = hass.loop
         self._last_data_time: float = 0.0
         self._watchdog_task: asyncio.Task[None] | None = None
         self._reconnect_task: asyncio.Task[None] | None = None
         self._reconnect_failures: int = 0
         self._connect_lock = asyncio.Lock()
 
+        # Listener fan-out is coalesced: Gen1 delivers L1 and L2 frames back to
+        # back and Gen2 can burst, so push at most once per cooldown window.
+        self._push_debouncer: Debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=STATE_PUSH_COOLDOWN,
+            immediate=True,
+            function=self._async_push_state,
+        )
+
     # ------------------------------------------------------------------
     # Public properties
     # ------------------------------------------------------------------
@@ -161,10 +210,18 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
     def is_dual_line(self) -> bool:
         return self._is_dual_line
 
+    @property
+    def availability(self) -> int:
+        return self._availability
+
     @property
     def address(self) -> str:
         return self._address
 
+    @property
+    def uid_prefix(self) -> str:
+        return self._uid_prefix
+
     @property
     def device_name(self) -> str:
         return self._device_name
@@ -175,13 +232,13 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
             return False
         if self._last_data_time == 0.0:
             return False
-        return (time.monotonic() - self._last_data_time) < STALE_TIMEOUT
+        return (self._loop.time() - self._last_data_time) < STALE_TIMEOUT
 
     @property
     def last_data_age(self) -> float | None:
         if self._last_data_time == 0.0:
             return None
-        return time.monotonic() - self._last_data_time
+        return self._loop.time() - self._last_data_time
 
     # ------------------------------------------------------------------
     # Connect / disconnect
@@ -247,6 +304,7 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
             return
 
         self._start_watchdog()
+        self._refresh_availability()
         self.async_update_listeners()
 
     async def _init_gen1(self, client: BleakClient) -> bool:
@@ -258,8 +316,7 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         FFF5 init writes (POWER ON TIME, SET:T) caused device instability and
         have been deliberately omitted.
         """
-        services = client.services
-        svc = services.get_service(GEN1_SERVICE_UUID)
+        svc = client.services.get_service(GEN1_SERVICE_UUID)
         if svc is None:
             _LOGGER.error(
                 "Gen1 service %s not found on %s — wrong device or generation",
@@ -268,7 +325,7 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
             )
             return False
 
-        notify_char = svc.get_characteristic(GEN1_NOTIFY_CHAR_UUID)
+        notify_char = _find_characteristic(svc, _GEN1_NOTIFY_CHAR_UUID_LOWER)
         if notify_char is None:
             _LOGGER.error("Gen1 notify characteristic %s not found", GEN1_NOTIFY_CHAR_UUID)
             return False
@@ -280,12 +337,13 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         await asyncio.sleep(2.0)
 
         self._gen1_assembler = Gen1FrameAssembler()
+        on_notify = self._make_gen1_handler(self._gen1_assembler)
 
         # Retry start_notify up to 3 times — BlueZ occasionally holds the notify
         # slot from a prior connection for a few seconds post-disconnect.
         for attempt in range(3):
             try:
-                await client.start_notify(notify_char, self._on_gen1_notification)
+                await client.start_notify(notify_char, on_notify)
                 _LOGGER.info("Gen1 notifications enabled on %s", GEN1_NOTIFY_CHAR_UUID)
                 break
             except BleakError as exc:
@@ -315,14 +373,17 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
 
     async def _init_gen2(self, client: BleakClient) -> bool:
         """Initialize Gen2 connection: find service, enable notifications, send open command."""
+        # A successful MTU query means the adapter has finished its post-connect
+        # exchange, so the conservative settle delays below can be shortened.
+        got_mtu = False
         try:
             mtu = await client.get_mtu_size()
             _LOGGER.debug("Hughes Gen2 %s: current MTU = %d", self._address, mtu)
+            got_mtu = True
         except Exception:  # noqa: BLE001
             _LOGGER.debug("Hughes Gen2: MTU query not supported on this adapter")
 
-        services = client.services
-        svc = services.get_service(GEN2_SERVICE_UUID)
+        svc = client.services.get_service(GEN2_SERVICE_UUID)
         if svc is None:
             _LOGGER.error(
                 "Gen2 service %s not found on %s — wrong device or generation",
@@ -331,7 +392,7 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
             )
             return False
 
-        rw_char = svc.get_characteristic(GEN2_RW_CHAR_UUID)
+        rw_char = _find_characteristic(svc, _GEN2_RW_CHAR_UUID_LOWER)
         if rw_char is None:
             _LOGGER.error("Gen2 R/W characteristic %s not found", GEN2_RW_CHAR_UUID)
             return False
@@ -339,25 +400,30 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         self._write_char_uuid = GEN2_RW_CHAR_UUID
         self._gen2_framer = Gen2PacketFramer()
         self._gen2_builder = Gen2CommandBuilder()
+        self._cmd_handlers[GEN2_CMD_DL_REPORT] = self._update_gen2_state
 
-        await asyncio.sleep(OPERATION_DELAY)
+        if not got_mtu:
+            await asyncio.sleep(OPERATION_DELAY)
 
-        await client.start_notify(rw_char, self._on_gen2_notification)
+        await client.start_notify(rw_char, self._make_gen2_handler(self._gen2_framer))
         _LOGGER.info("Gen2 notifications enabled on %s", GEN2_RW_CHAR_UUID)
 
         try:
-            await client.write_gatt_char(GEN2_RW_CHAR_UUID, GEN2_PROTOCOL_OPEN_CMD, response=True)
+            await client.write_gatt_char(rw_char, GEN2_PROTOCOL_OPEN_CMD, response=True)
             _LOGGER.debug("Sent Gen2 protocol open command")
         except (BleakError, TimeoutError, OSError) as exc:
             _LOGGER.warning("Gen2 open command write failed: %s (continuing)", exc)
 
-        await asyncio.sleep(GEN2_INIT_SETTLE_DELAY)
+        await asyncio.sleep(
+            GEN2_INIT_SETTLE_DELAY / 2 if got_mtu else GEN2_INIT_SETTLE_DELAY
+        )
         return True
 
     async def async_disconnect(self) -> None:
         """Disconnect and clean up."""
         self._stop_watchdog()
         self._cancel_reconnect()
+        self._push_debouncer.async_cancel()
         if self._client:
             await self._safe_disconnect(self._client)
         self._client = None
@@ -367,7 +433,9 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         self._gen2_framer = None
         self._gen2_builder = None
         self._first_data_received = False
+        self._awaiting_ok = True
         self._is_dual_line = False
+        self._refresh_availability()
         self.async_update_listeners()
 
     async def _safe_disconnect(self, client: BleakClient) -> None:
@@ -408,10 +476,12 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         # Reset per-connection state so first-data and dual-line logs fire again
         # on the next reconnect, confirming both lines are receiving data.
         self._first_data_received = False
+        self._awaiting_ok = True
         self._is_dual_line = False
         if self.state is not None:
             self.state.line2 = None
             self.state.is_dual_line = False
+        self._refresh_availability()
         self.async_update_listeners()
         self._schedule_reconnect()
 
@@ -423,10 +493,10 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
         """Schedule a reconnect attempt with exponential backoff."""
         self._cancel_reconnect()
         self._reconnect_failures += 1
-        delay = min(
-            RECONNECT_BACKOFF_BASE * (2 ** (self._reconnect_failures - 1)),
-            RECONNECT_BACKOFF_CAP,
-        )
+        # Clamp the exponent so a device that stays offline for days doesn't keep
+        # building ever-larger ints only for min() to discard them.
+        exp = min(self._reconnect_failures - 1, 30)
+        delay = min(RECONNECT_BACKOFF_BASE * (1 << exp), RECONNECT_BACKOFF_CAP)
         _LOGGER.info(
             "Hughes %s: reconnecting in %.0fs (attempt %d)",
             self._address,
@@ -476,7 +546,7 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
                 if not self._connected:
                     break
                 if self._last_data_time > 0.0:
-                    age = time.monotonic() - self._last_data_time
+                    age = self._loop.time() - self._last_data_time
                     if age > STALE_TIMEOUT:
                         _LOGGER.warning(
                             "Hughes %s: no data for %.0fs — forcing reconnect",
@@ -493,26 +563,42 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
     # Notification handlers
     # ------------------------------------------------------------------
 
-    def _on_gen1_notification(
-        self, characteristic: BleakGATTCharacteristic, data: bytearray
-    ) -> None:
-        """Handle a 20-byte Gen1 notification chunk."""
-        if self._gen1_assembler is None:
-            return
-        result = self._gen1_assembler.feed(bytes(data))
-        if result is None:
-            return
-        line_data, is_line2 = result
-        self._last_data_time = time.monotonic()
-        self.hass.async_create_task(self._update_gen1_state(line_data, is_line2))
+    def _make_gen1_handler(
+        self, assembler: Gen1FrameAssembler
+    ) -> Callable[[BleakGATTCharacteristic, bytearray], None]:
+        """Build the Gen1 notify callback for one connection.
+
+        The assembler, clock and state merge are captured up front so the
+        per-notification path does not repeat attribute lookups on self.
+        """
+        feed = assembler.feed
+        loop_time = self._loop.time
+        update = self._update_gen1_state
+
+        def _on_gen1_notification(
+            characteristic: BleakGATTCharacteristic, data: bytearray
+        ) -> None:
+            """Handle a 20-byte Gen1 notification chunk."""
+            if self._gen1_assembler is not assembler:
+                return  # late notification from a torn-down connection
+            result = feed(data)
+            if result is None:
+                return
+            self._last_data_time = loop_time()
+            update(*result)
+
+        return _on_gen1_notification
 
-    async def _update_gen1_state(self, line_data: HughesLineData, is_line2: bool) -> None:
+    @callback
+    def _update_gen1_state(self, line_data: HughesLineData, is_line2: bool) -> None:
         """Merge parsed Gen1 frame into coordinator state and notify entities."""
         if self.state is None:
+            # An L2 frame can arrive first; L1 then reads as zeros until its frame lands.
             self.state = HughesState(
                 generation=GEN1,
                 is_enhanced=False,
                 is_dual_line=False,
+                line1=HughesLineData() if is_line2 else line_data,
             )
 
         if is_line2:
@@ -554,38 +640,57 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
                 self.state.line1.power + self.state.line2.power,
             )
 
-        self.async_set_updated_data(self.state)
-
-    def _on_gen2_notification(
-        self, characteristic: BleakGATTCharacteristic, data: bytearray
-    ) -> None:
-        """Handle a Gen2 BLE notification chunk."""
-        if self._gen2_framer is None:
-            return
-
-        if not self._first_data_received:
-            try:
-                text = bytes(data).decode("ascii", errors="ignore").strip()
-                if text == "ok":
-                    _LOGGER.debug("Hughes Gen2 %s: received protocol open 'ok'", self._address)
-                    return
-            except Exception:  # noqa: BLE001
-                pass
-
-        packets = self._gen2_framer.feed(bytes(data))
-        for packet in packets:
-            self._last_data_time = time.monotonic()
-            if packet.command == GEN2_CMD_DL_REPORT:
-                self.hass.async_create_task(self._update_gen2_state(packet.body))
-            else:
+        self._push_debouncer.async_schedule_call()
+
+    def _make_gen2_handler(
+        self, framer: Gen2PacketFramer
+    ) -> Callable[[BleakGATTCharacteristic, bytearray], None]:
+        """Build the Gen2 notify callback for one connection (see _make_gen1_handler)."""
+        feed = framer.feed
+        loop_time = self._loop.time
+        get_handler = self._cmd_handlers.get
+
+        def _on_gen2_notification(
+            characteristic: BleakGATTCharacteristic, data: bytearray
+        ) -> None:
+            """Handle a Gen2 BLE notification chunk."""
+            if self._gen2_framer is not framer:
+                return  # late notification from a torn-down connection
+
+            # The open ack is a bare ASCII "ok" (possibly with CR/LF); compare
+            # raw bytes rather than decoding every pre-data notification.
+            if (
+                self._awaiting_ok
+                and len(data) <= 8
+                and data.strip() == GEN2_PROTOCOL_OK_RESPONSE
+            ):
                 _LOGGER.debug(
-                    "Hughes Gen2 %s: unhandled command 0x%02X (msg_id=%d)",
-                    self._address,
-                    packet.command,
-                    packet.msg_id,
+                    "Hughes Gen2 %s: received protocol open 'ok'", self._address
                 )
+                self._awaiting_ok = False
+                return
+
+            packets = feed(data)
+            if packets:
+                # Binary mode is established; retire the ack sniff for this connection.
+                self._awaiting_ok = False
+            for packet in packets:
+                self._last_data_time = loop_time()
+                handler = get_handler(packet.command)
+                if handler is not None:
+                    handler(packet.body)
+                else:
+                    _LOGGER.debug(
+                        "Hughes Gen2 %s: unhandled command 0x%02X (msg_id=%d)",
+                        self._address,
+                        packet.command,
+                        packet.msg_id,
+                    )
+
+        return _on_gen2_notification
 
-    async def _update_gen2_state(self, body: bytes) -> None:
+    @callback
+    def _update_gen2_state(self, body: bytes) -> None:
         """Parse a Gen2 DLReport body and push state to entities."""
         result = parse_dl_report(body, self._is_enhanced)
         if result is None:
@@ -593,20 +698,29 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
 
         line1, line2 = result
         is_dual = line2 is not None
-
         if is_dual and not self._is_dual_line:
             _LOGGER.info("Hughes Gen2 %s: dual-line device confirmed", self._address)
             self._is_dual_line = True
 
-        self.state = HughesState(
-            generation=GEN2,
-            is_enhanced=self._is_enhanced,
-            is_dual_line=is_dual,
-            line1=line1,
-            line2=line2,
-            last_seen=self._last_data_time,
-            raw_bytes=body,
-        )
+        state = self.state
+        if state is None or state.generation != GEN2:
+            self.state = HughesState(
+                generation=GEN2,
+                is_enhanced=self._is_enhanced,
+                is_dual_line=is_dual,
+                line1=line1,
+                line2=line2,
+                last_seen=self._last_data_time,
+                raw_bytes=body,
+            )
+        else:
+            # Steady state: update the existing snapshot in place (as Gen1 does)
+            # rather than allocating a new HughesState per DLReport.
+            state.is_dual_line = is_dual
+            state.line1 = line1
+            state.line2 = line2
+            state.last_seen = self._last_data_time
+            state.raw_bytes = body
 
         if not self._first_data_received:
             self._first_data_received = True
@@ -619,8 +733,27 @@ class HughesCoordinator(DataUpdateCoordinator[HughesState | None]):
                 line1.error_text,
             )
 
+        self._push_debouncer.async_schedule_call()
+
+    @callback
+    def _async_push_state(self) -> None:
+        """Publish the current state to listening entities (debounced)."""
+        self._refresh_availability()
         self.async_set_updated_data(self.state)
 
+    @callback
+    def _refresh_availability(self) -> None:
+        """Recompute the AVAIL_* bitmask from link and state."""
+        mask = AVAIL_CONNECTED if self._connected else 0
+        state = self.state
+        if state is not None:
+            mask |= AVAIL_STATE
+            if state.is_enhanced:
+                mask |= AVAIL_ENHANCED
+            if state.is_dual_line:
+                mask |= AVAIL_DUAL_LINE
+        self._availability = mask
+
     # ------------------------------------------------------------------
     # Gen2 command methods
     # ------------------------------------------------------------------
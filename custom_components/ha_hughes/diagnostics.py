@@ -18,6 +18,18 @@ from .coordinator import HughesCoordinator
 # No secrets to redact for Hughes (no auth credentials)
 TO_REDACT_CONFIG: set[str] = set()
 
+# (output key, coordinator attribute) for the "connection" section
+_CONNECTION_FIELDS: tuple[tuple[str, str], ...] = (
+    ("connected", "connected"),
+    ("data_healthy", "data_healthy"),
+    ("last_data_age_seconds", "last_data_age"),
+    ("reconnect_failures", "_reconnect_failures"),
+    ("generation", "generation"),
+    ("is_enhanced", "is_enhanced"),
+    ("is_dual_line", "is_dual_line"),
+    ("device_name", "device_name"),
+)
+
 
 async def async_get_config_entry_diagnostics(
     hass: HomeAssistant, entry: ConfigEntry
@@ -27,36 +39,11 @@ async def async_get_config_entry_diagnostics(
 
     # Connection / health state
     connection: dict[str, Any] = {
-        "connected": coordinator.connected,
-        "data_healthy": coordinator.data_healthy,
-        "last_data_age_seconds": (
-            round(coordinator.last_data_age, 1)
-            if coordinator.last_data_age is not None
-            else None
-        ),
-        "reconnect_failures": coordinator._reconnect_failures,
-        "generation": coordinator.generation,
-        "is_enhanced": coordinator.is_enhanced,
-        "is_dual_line": coordinator.is_dual_line,
-        "device_name": coordinator.device_name,
+        key: getattr(coordinator, attr) for key, attr in _CONNECTION_FIELDS
     }
-
-    def _line_dict(line: Any) -> dict[str, Any]:
-        return {
-            "voltage_v": line.voltage,
-            "current_a": line.current,
-            "power_w": line.power,
-            "energy_kwh": line.energy,
-            "frequency_hz": line.frequency,
-            "error_code": line.error_code,
-            "error_text": line.error_text,
-            "relay_on": line.relay_on,
-            "neutral_detection": line.neutral_detection,
-            "backlight": line.backlight,
-            "output_voltage_v": line.output_voltage,
-            "boost": line.boost,
-            "temperature_f": line.temperature_f,
-        }
+    age = connection["last_data_age_seconds"]
+    if age is not None:
+        connection["last_data_age_seconds"] = round(age, 1)
 
     # Parsed state
     state_data: dict[str, Any] = {}
@@ -66,8 +53,8 @@ async def async_get_config_entry_diagnostics(
             "generation": s.generation,
             "is_enhanced": s.is_enhanced,
             "is_dual_line": s.is_dual_line,
-            "line1": _line_dict(s.line1),
-            "line2": _line_dict(s.line2) if s.line2 is not None else None,
+            "line1": s.line1.as_dict(),
+            "line2": s.line2.as_dict() if s.line2 is not None else None,
             "last_seen_age_seconds": (
                 round(coordinator.last_data_age, 1)
                 if coordinator.last_data_age is not None
@@ -0,0 +1,55 @@
+"""Shared entity base for the Hughes Power Watchdog BLE integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import AVAIL_BASIC
+from .coordinator import HughesCoordinator
+
+
+class HughesCachedEntity(CoordinatorEntity[HughesCoordinator]):
+    """Coordinator entity that caches its availability and native value.
+
+    The coordinator fires on every BLE notification, and HA reads available
+    and native_value several times per state write. Both are therefore
+    computed once per update in _refresh_attrs and served from _attr_*.
+    Subclasses set _required (the AVAIL_* mask they need) and implement
+    _compute_native_value.
+
+    CoordinatorEntity.available only reports last_update_success and ignores
+    _attr_available, so available combines the two explicitly.
+    """
+
+    _required: int = AVAIL_BASIC
+
+    async def async_added_to_hass(self) -> None:
+        """Seed the cached attributes before the first state write."""
+        await super().async_added_to_hass()
+        self._refresh_attrs()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Refresh cached attributes, then write state."""
+        self._refresh_attrs()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _refresh_attrs(self) -> None:
+        """Recompute the cached availability and native value."""
+        self._attr_available = (
+            self.coordinator.availability & self._required
+        ) == self._required
+        self._attr_native_value = self._compute_native_value()
+
+    def _compute_native_value(self) -> Any:
+        """Return the native value for the current coordinator state."""
+        raise NotImplementedError
+
+    @property
+    def available(self) -> bool:
+        """Available when the last update succeeded and the cached check passed."""
+        return super().available and self._attr_available
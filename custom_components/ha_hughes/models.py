@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Literal
+from dataclasses import dataclass
+from typing import Any, Literal
 
 Generation = Literal["gen1", "gen2"]
 
 
-@dataclass
+@dataclass(slots=True)
 class HughesLineData:
-    """Parsed data for a single power line (L1 or L2)."""
+    """Parsed data for a single power line (L1 or L2).
+
+    Scaled fields are stored unrounded: the parsers divide the raw integer by a
+    power of ten, which already yields the closest double to the n-decimal
+    value, so round() to n places would be a no-op. (Multiplying by a
+    precomputed reciprocal would not have that property.) Display precision is
+    left to each sensor's suggested_display_precision.
+    """
 
     # Common — Gen1 and Gen2
     voltage: float = 0.0         # V
@@ -31,15 +38,37 @@ class HughesLineData:
     boost: bool | None = None
     temperature_f: float | None = None  # °F
 
+    def as_dict(self) -> dict[str, Any]:
+        """Return this line as a JSON-friendly dict with unit-suffixed keys."""
+        return {key: getattr(self, attr) for key, attr in _LINE_FIELDS}
+
+
+# (output key, HughesLineData attribute) in as_dict() order
+_LINE_FIELDS: tuple[tuple[str, str], ...] = (
+    ("voltage_v", "voltage"),
+    ("current_a", "current"),
+    ("power_w", "power"),
+    ("energy_kwh", "energy"),
+    ("frequency_hz", "frequency"),
+    ("error_code", "error_code"),
+    ("error_text", "error_text"),
+    ("relay_on", "relay_on"),
+    ("neutral_detection", "neutral_detection"),
+    ("backlight", "backlight"),
+    ("output_voltage_v", "output_voltage"),
+    ("boost", "boost"),
+    ("temperature_f", "temperature_f"),
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class HughesState:
     """Full parsed state from a Hughes Power Watchdog device."""
 
     generation: Generation
     is_enhanced: bool         # Gen2 E8/V8/E9/V9 only
     is_dual_line: bool
-    line1: HughesLineData = field(default_factory=HughesLineData)
+    line1: HughesLineData
     line2: HughesLineData | None = None
     last_seen: float = 0.0    # monotonic timestamp of last successful parse
     raw_bytes: bytes | None = None  # last raw payload for diagnostics
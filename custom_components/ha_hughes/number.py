@@ -14,11 +14,12 @@ from homeassistant.components.number import NumberEntity, NumberMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_DEVICE_NAME, DOMAIN, GEN2_BACKLIGHT_MAX
 from .coordinator import HughesCoordinator
+from .entity import HughesCachedEntity
 from .sensor import _make_device_info
 
 _LOGGER = logging.getLogger(__name__)
@@ -31,13 +32,16 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hughes number entities from a config entry."""
     coordinator: HughesCoordinator = hass.data[DOMAIN][entry.entry_id]
-    address = entry.data[CONF_ADDRESS]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "")
+    device_info = _make_device_info(
+        entry.data[CONF_ADDRESS], entry.data.get(CONF_DEVICE_NAME, "")
+    )
 
-    async_add_entities([HughesBacklightNumber(coordinator, address, device_name)])
+    async_add_entities(
+        [HughesBacklightNumber(coordinator, device_info)]
+    )
 
 
-class HughesBacklightNumber(CoordinatorEntity[HughesCoordinator], NumberEntity):
+class HughesBacklightNumber(HughesCachedEntity, NumberEntity):
     """Number entity for the Hughes Gen2 display backlight level.
 
     Range 0–5; sends CMD_SET_BACKLIGHT (0x07).
@@ -54,24 +58,16 @@ class HughesBacklightNumber(CoordinatorEntity[HughesCoordinator], NumberEntity):
     _attr_mode = NumberMode.SLIDER
 
     def __init__(
-        self, coordinator: HughesCoordinator, address: str, device_name: str
+        self, coordinator: HughesCoordinator, device_info: DeviceInfo
     ) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_backlight"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + "backlight"
+        self._attr_device_info = device_info
 
-    @property
-    def available(self) -> bool:
-        """Available when connected and we have state."""
-        return self.coordinator.connected and self.coordinator.state is not None
-
-    @property
-    def native_value(self) -> float | None:
+    def _compute_native_value(self) -> float | None:
         """Return the current backlight level."""
-        if self.coordinator.state is None:
-            return None
-        bl = self.coordinator.state.line1.backlight
+        state = self.coordinator.state
+        bl = state.line1.backlight if state is not None else None
         return float(bl) if bl is not None else None
 
     async def async_set_native_value(self, value: float) -> None:
@@ -1 +1,33 @@
 """Hughes Power Watchdog protocol parsers."""
+
+from __future__ import annotations
+
+import struct
+
+
+def fixed_layout(fields: tuple[tuple[int, str], ...], size: int) -> struct.Struct:
+    """Build a big-endian Struct over a fixed-size record from field offsets.
+
+    fields is a sequence of (offset, format_char) pairs in ascending offset
+    order; gaps between them (and up to size) become pad bytes, so a layout is
+    derived directly from the protocol's offset constants.
+
+    Raises ValueError if a field overlaps the previous one or runs past size,
+    so a mistyped offset fails at import instead of silently misparsing.
+    """
+    fmt = ">"
+    pos = 0
+    for offset, code in fields:
+        if offset < pos:
+            raise ValueError(
+                f"field {code!r} at offset {offset} overlaps previous field ending at {pos}"
+            )
+        if offset > pos:
+            fmt += f"{offset - pos}x"
+        fmt += code
+        pos = offset + struct.calcsize(">" + code)
+    if pos > size:
+        raise ValueError(f"fields end at offset {pos}, past the {size}-byte record")
+    if pos < size:
+        fmt += f"{size - pos}x"
+    return struct.Struct(fmt)
@@ -13,13 +13,12 @@ Reference: Android HughesWatchdogDevicePlugin.kt / HughesGattCallback
 from __future__ import annotations
 
 import logging
-import struct
 import time
 
 from ..const import (
     GEN1_CHUNK_SIZE,
     GEN1_CHUNK_TIMEOUT,
-    GEN1_ERROR_CODES,
+    GEN1_ERROR_TEXTS,
     GEN1_FRAME_HEADER,
     GEN1_FRAME_SIZE,
     GEN1_OFF_CURRENT,
@@ -32,6 +31,7 @@ from ..const import (
     GEN1_SCALE_POWER,
 )
 from ..models import HughesLineData
+from . import fixed_layout
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,10 +49,22 @@ _MAX_POWER = 60_000.0         # W   — 240 V x ~100 A + headroom
 _MAX_ENERGY = 10_000_000.0    # kWh — lifetime cumulative (~a century at full load)
 _MAX_FREQUENCY = 100.0        # Hz  — nominal 60 + headroom
 
+_GEN1_HEADER_HEX = GEN1_FRAME_HEADER.hex()  # static half of the mismatch log
 
-def _parse_int32_be(data: bytes, offset: int) -> int:
-    """Parse a big-endian signed int32 from data at offset."""
-    return struct.unpack_from(">i", data, offset)[0]
+
+# Every field in one precompiled unpack:
+#   voltage, current, power, energy, error, frequency, marker0..2
+_GEN1_FRAME = fixed_layout((
+    (GEN1_OFF_VOLTAGE, "i"),
+    (GEN1_OFF_CURRENT, "i"),
+    (GEN1_OFF_POWER, "i"),
+    (GEN1_OFF_ENERGY, "i"),
+    (GEN1_OFF_ERROR, "B"),
+    (GEN1_OFF_FREQUENCY, "i"),
+    (GEN1_OFF_LINE_MARKER, "B"),
+    (GEN1_OFF_LINE_MARKER + 1, "B"),
+    (GEN1_OFF_LINE_MARKER + 2, "B"),
+), GEN1_FRAME_SIZE)
 
 
 def _values_plausible(
@@ -73,7 +85,7 @@ def _values_plausible(
     )
 
 
-def parse_gen1_frame(frame: bytes) -> tuple[HughesLineData, bool] | None:
+def parse_gen1_frame(frame: bytes | bytearray) -> tuple[HughesLineData, bool] | None:
     """Parse a complete 40-byte Gen1 frame.
 
     Returns (HughesLineData, is_line2) or None on parse error.
@@ -83,56 +95,52 @@ def parse_gen1_frame(frame: bytes) -> tuple[HughesLineData, bool] | None:
         _LOGGER.debug("Gen1 frame too short: %d bytes", len(frame))
         return None
 
-    if frame[0:3] != GEN1_FRAME_HEADER:
-        _LOGGER.debug(
-            "Gen1 frame header mismatch: %s (expected %s)",
-            frame[0:3].hex(),
-            GEN1_FRAME_HEADER.hex(),
-        )
+    if not frame.startswith(GEN1_FRAME_HEADER):
+        # The .hex() arguments are built eagerly; skip them unless they'll be logged.
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Gen1 frame header mismatch: %s (expected %s)",
+                frame[0:3].hex(),
+                _GEN1_HEADER_HEX,
+            )
         return None
 
-    try:
-        voltage = _parse_int32_be(frame, GEN1_OFF_VOLTAGE) / GEN1_SCALE_POWER
-        current = _parse_int32_be(frame, GEN1_OFF_CURRENT) / GEN1_SCALE_POWER
-        power = _parse_int32_be(frame, GEN1_OFF_POWER) / GEN1_SCALE_POWER
-        energy = _parse_int32_be(frame, GEN1_OFF_ENERGY) / GEN1_SCALE_POWER
-        frequency = _parse_int32_be(frame, GEN1_OFF_FREQUENCY) / 100.0
-        error_code = frame[GEN1_OFF_ERROR]
-        error_text = GEN1_ERROR_CODES.get(error_code, f"Unknown ({error_code})")
-
-        # Line detection: bytes [37:40] all 0x00 = L1, any non-zero = L2
-        marker = frame[GEN1_OFF_LINE_MARKER:GEN1_OFF_LINE_MARKER + 3]
-        is_line2 = any(b != 0 for b in marker)
-
-    except (struct.error, IndexError) as exc:
-        _LOGGER.warning("Gen1 frame parse error: %s", exc)
-        return None
+    # Length was checked above, so the unpack itself cannot fail.
+    (
+        voltage_raw, current_raw, power_raw, energy_raw,
+        error_code, freq_raw, m0, m1, m2,
+    ) = _GEN1_FRAME.unpack_from(frame)
+    voltage = voltage_raw / GEN1_SCALE_POWER
+    current = current_raw / GEN1_SCALE_POWER
+    power = power_raw / GEN1_SCALE_POWER
+    energy = energy_raw / GEN1_SCALE_POWER
+    frequency = freq_raw / 100.0
+    error_text = GEN1_ERROR_TEXTS[error_code]
+
+    # Line detection: bytes [37:40] all 0x00 = L1, any non-zero = L2
+    is_line2 = (m0 | m1 | m2) != 0
 
     # Reject misassembled frames whose values are physically impossible. This
     # keeps garbage out of the live state and, critically, out of long-term
     # statistics (see _values_plausible / issue #3).
     if not _values_plausible(voltage, current, power, energy, frequency):
-        _LOGGER.debug(
-            "Gen1: implausible frame discarded "
-            "(V=%.4f A=%.4f W=%.4f kWh=%.4f Hz=%.4f) raw=%s",
-            voltage,
-            current,
-            power,
-            energy,
-            frequency,
-            frame.hex(),
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Gen1: implausible frame discarded "
+                "(V=%.4f A=%.4f W=%.4f kWh=%.4f Hz=%.4f) raw=%s",
+                voltage,
+                current,
+                power,
+                energy,
+                frequency,
+                frame.hex(),
+            )
         return None
 
+    # Positional in HughesLineData field order; unrounded (see HughesLineData).
     return (
         HughesLineData(
-            voltage=round(voltage, 4),
-            current=round(current, 4),
-            power=round(power, 4),
-            energy=round(energy, 4),
-            frequency=round(frequency, 2),
-            error_code=error_code,
-            error_text=error_text,
+            voltage, current, power, energy, frequency, error_code, error_text
         ),
         is_line2,
     )
@@ -149,54 +157,72 @@ class Gen1FrameAssembler:
     """
 
     def __init__(self) -> None:
-        self._chunk1: bytes | None = None
+        # Both chunks are copied straight into one reusable frame buffer, so
+        # assembling a frame needs no per-notification bytes objects.
+        self._frame = bytearray(GEN1_FRAME_SIZE)
+        self._view = memoryview(self._frame)
+        self._chunk1_len: int | None = None  # size of the buffered first chunk
         self._chunk1_time: float = 0.0
 
-    def feed(self, data: bytes | bytearray) -> tuple[HughesLineData, bool] | None:
+    def _store_first(self, data: bytes | bytearray | memoryview, now: float) -> None:
+        """Buffer data as the first chunk of a new frame pair."""
+        n = min(len(data), GEN1_FRAME_SIZE)
+        self._view[:n] = memoryview(data)[:n]
+        self._chunk1_len = len(data)
+        self._chunk1_time = now
+
+    def feed(self, data: bytes | bytearray | memoryview) -> tuple[HughesLineData, bool] | None:
         """Feed a 20-byte notification chunk.
 
         Returns a parsed (HughesLineData, is_line2) tuple when a complete frame
         is assembled, or None if more data is needed.
         """
-        chunk = bytes(data)
+        size = len(data)
+        now = time.monotonic()
+
+        # Steady state alternates the two 20-byte paths below, so they are
+        # tested first; expiry and odd-sized chunks fall through to the end.
+        if size == GEN1_CHUNK_SIZE:
+            start = self._chunk1_len
+            if start is None:
+                # First chunk of a frame pair
+                self._store_first(data, now)
+                _LOGGER.debug("Gen1: stored first chunk")
+                return None
+
+            age = now - self._chunk1_time
+            if age <= GEN1_CHUNK_TIMEOUT:
+                # Second chunk: assemble the frame in place behind the first
+                self._chunk1_len = None
+                if start < GEN1_FRAME_SIZE:
+                    n = min(size, GEN1_FRAME_SIZE - start)
+                    self._view[start: start + n] = memoryview(data)[:n]
+                    end = start + n
+                else:
+                    end = GEN1_FRAME_SIZE
+                # A short first chunk leaves a short frame, which the parser rejects.
+                frame = self._frame if end == GEN1_FRAME_SIZE else self._frame[:end]
+
+                result = parse_gen1_frame(frame)
+                if result is None:
+                    _LOGGER.debug("Gen1: frame parse failed — resetting")
+                return result
 
-        if len(chunk) != GEN1_CHUNK_SIZE:
-            _LOGGER.debug(
-                "Unexpected Gen1 chunk size: %d (expected %d)", len(chunk), GEN1_CHUNK_SIZE
-            )
-            # Non-standard chunk: attempt to use as start of a new frame pair anyway
-            self._chunk1 = chunk
-            self._chunk1_time = time.monotonic()
-            return None
-
-        if self._chunk1 is None:
-            # First chunk of a frame pair
-            self._chunk1 = chunk
-            self._chunk1_time = time.monotonic()
-            _LOGGER.debug("Gen1: stored first chunk")
-            return None
-
-        # Check if first chunk has expired
-        age = time.monotonic() - self._chunk1_time
-        if age > GEN1_CHUNK_TIMEOUT:
             _LOGGER.debug(
                 "Gen1: first chunk expired (%.2fs old) — treating current chunk as new first",
                 age,
             )
-            self._chunk1 = chunk
-            self._chunk1_time = time.monotonic()
+            self._store_first(data, now)
             return None
 
-        # Assemble 40-byte frame
-        frame = self._chunk1 + chunk
-        self._chunk1 = None
-
-        result = parse_gen1_frame(frame)
-        if result is None:
-            _LOGGER.debug("Gen1: frame parse failed — resetting")
-        return result
+        _LOGGER.debug(
+            "Unexpected Gen1 chunk size: %d (expected %d)", size, GEN1_CHUNK_SIZE
+        )
+        # Non-standard chunk: attempt to use as start of a new frame pair anyway
+        self._store_first(data, now)
+        return None
 
     def reset(self) -> None:
         """Discard any buffered partial frame."""
-        self._chunk1 = None
+        self._chunk1_len = None
         self._chunk1_time = 0.0
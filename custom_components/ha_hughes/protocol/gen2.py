@@ -19,7 +19,9 @@ from __future__ import annotations
 import datetime
 import logging
 import struct
+import time
 from dataclasses import dataclass
+from typing import Any
 
 from ..const import (
     GEN2_BACKLIGHT_MAX,
@@ -30,7 +32,7 @@ from ..const import (
     GEN2_CMD_SET_TIME,
     GEN2_DLREPORT_DUAL_SIZE,
     GEN2_DLREPORT_SINGLE_SIZE,
-    GEN2_ERROR_CODES,
+    GEN2_ERROR_TEXTS,
     GEN2_HEADER_SIZE,
     GEN2_MAGIC,
     GEN2_MSG_ID_MAX,
@@ -55,15 +57,23 @@ from ..const import (
     GEN2_TAIL_SIZE,
 )
 from ..models import HughesLineData
+from . import fixed_layout
 
 _LOGGER = logging.getLogger(__name__)
 
+# Precompiled big-endian codecs: struct.Struct parses its format once, where the
+# module-level struct functions re-resolve it on every call.
+_U16_BE = struct.Struct(">H")
+_HEADER = struct.Struct(">4sBBBH")  # magic, version, msg_id, cmd, data_len
+_OFF_MSG_ID = 5
+_unpack_u16 = _U16_BE.unpack_from
+
 
 # ---------------------------------------------------------------------------
 # Packet data structure
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Gen2Packet:
     """A fully parsed Gen2 BLE packet."""
 
@@ -76,9 +86,22 @@ class Gen2Packet:
 # Packet framer: reassembles fragmented BLE notifications into complete packets
 # ---------------------------------------------------------------------------
 
+# Reassembly buffer size. A dual-line DLReport packet is 79 bytes, so this holds
+# several packets plus a max-MTU notification; a header declaring a body that
+# cannot fit is treated as corrupt rather than waited on.
+_FRAMER_CAPACITY = 512
+_MAGIC_KEEP = len(GEN2_MAGIC) - 1
+_GEN2_TAIL_HEX = GEN2_TAIL.hex()  # static half of the bad-tail log
+
+
 class Gen2PacketFramer:
     """Reassembles Gen2 binary framed packets from BLE notification chunks.
 
+    Notifications are copied into one preallocated buffer and parsed in place;
+    the only per-packet allocation is the emitted body. Consumed bytes just
+    advance a head index, and the live region is only shifted back to the
+    start when an incoming chunk would not otherwise fit.
+
     Usage:
         framer = Gen2PacketFramer()
         for packet in framer.feed(notification_data):
@@ -86,134 +109,238 @@ class Gen2PacketFramer:
     """
 
     def __init__(self) -> None:
-        self._buffer = bytearray()
+        self._buffer = bytearray(_FRAMER_CAPACITY)
+        self._view = memoryview(self._buffer)
+        self._head = 0  # start of unconsumed data
+        self._len = 0   # end of valid data
 
-    def feed(self, data: bytes | bytearray) -> list[Gen2Packet]:
+    def feed(self, data: bytes | bytearray | memoryview) -> list[Gen2Packet]:
         """Append notification data and return any complete packets found."""
-        self._buffer.extend(data)
         packets: list[Gen2Packet] = []
+        src = memoryview(data)
+
+        # Normally the whole notification fits in one copy; looping only
+        # matters if a pathological burst outruns the free space.
+        while True:
+            if self._head and self._len + len(src) > _FRAMER_CAPACITY:
+                self._compact()
+            n = min(len(src), _FRAMER_CAPACITY - self._len)
+            if src and not n:
+                # Full of bytes that never framed; nothing left worth keeping.
+                _LOGGER.debug("Gen2 framer: buffer overflow — resetting")
+                self.reset()
+                continue
+            self._view[self._len: self._len + n] = src[:n]
+            self._len += n
+            src = src[n:]
+
+            self._extract(packets)
+
+            if not src:
+                return packets
+
+    def _extract(self, packets: list[Gen2Packet]) -> None:
+        """Append every complete packet in the buffer to packets.
+
+        Walks the buffer with local cursors and writes them back once at the
+        end. Any framing error (bad version, implausible length, bad tail)
+        skips one byte and resumes the magic search immediately, so a corrupt
+        packet never holds back a valid one behind it in the same notification.
+        """
+        buf = self._buffer
+        view = self._view
+        head = self._head
+        end = self._len
 
         while True:
-            packet = self._try_extract()
-            if packet is None:
+            # Find magic header
+            idx = buf.find(GEN2_MAGIC, head, end)
+            if idx < 0:
+                # No magic found; keep a partial-magic tail in case it spans two notifications
+                head = max(head, end - _MAGIC_KEEP)
                 break
-            packets.append(packet)
 
-        return packets
+            if idx > head:
+                _LOGGER.debug("Gen2 framer: discarding %d bytes before magic", idx - head)
+                head = idx
 
-    def _try_extract(self) -> Gen2Packet | None:
-        """Try to extract one complete packet from the front of the buffer."""
-        buf = self._buffer
+            # Need at least a full header
+            if end - head < GEN2_HEADER_SIZE:
+                break
 
-        # Find magic header
-        magic_idx = self._find_magic()
-        if magic_idx < 0:
-            # No magic found; keep last 3 bytes in case magic spans two notifications
-            if len(buf) > 3:
-                del self._buffer[: len(buf) - 3]
-            return None
-
-        if magic_idx > 0:
-            _LOGGER.debug("Gen2 framer: discarding %d bytes before magic", magic_idx)
-            del self._buffer[:magic_idx]
-            buf = self._buffer
-
-        # Need at least a full header
-        if len(buf) < GEN2_HEADER_SIZE:
-            return None
-
-        # Check version
-        if buf[4] != GEN2_PROTOCOL_VERSION:
-            _LOGGER.debug("Gen2 framer: unexpected protocol version 0x%02X", buf[4])
-            del self._buffer[:1]  # skip this magic byte and try again
-            return None
-
-        msg_id = buf[5]
-        command = buf[6]
-        data_len = struct.unpack_from(">H", buf, 7)[0]
-
-        total_len = GEN2_HEADER_SIZE + data_len + GEN2_TAIL_SIZE
-        if len(buf) < total_len:
-            return None  # incomplete packet, wait for more data
-
-        # Validate tail
-        tail_start = GEN2_HEADER_SIZE + data_len
-        tail = bytes(buf[tail_start: tail_start + GEN2_TAIL_SIZE])
-        if tail != GEN2_TAIL:
-            _LOGGER.debug(
-                "Gen2 framer: bad tail %s (expected %s) — skipping",
-                tail.hex(),
-                GEN2_TAIL.hex(),
+            # Check version
+            if buf[head + 4] != GEN2_PROTOCOL_VERSION:
+                _LOGGER.debug(
+                    "Gen2 framer: unexpected protocol version 0x%02X", buf[head + 4]
+                )
+                head += 1  # skip this magic byte and try again
+                continue
+
+            data_len = _unpack_u16(buf, head + 7)[0]
+            total_len = GEN2_HEADER_SIZE + data_len + GEN2_TAIL_SIZE
+            if total_len > _FRAMER_CAPACITY:
+                _LOGGER.debug("Gen2 framer: implausible body length %d — skipping", data_len)
+                head += 1
+                continue
+            if end - head < total_len:
+                break  # incomplete packet, wait for more data
+
+            # Validate tail
+            tail_start = head + GEN2_HEADER_SIZE + data_len
+            tail = view[tail_start: tail_start + GEN2_TAIL_SIZE]
+            if tail != GEN2_TAIL:
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "Gen2 framer: bad tail %s (expected %s) — skipping",
+                        tail.hex(),
+                        _GEN2_TAIL_HEX,
+                    )
+                head += 1
+                continue
+
+            # Only the body outlives this call, so it is the one copy we make.
+            packets.append(
+                Gen2Packet(
+                    msg_id=buf[head + 5],
+                    command=buf[head + 6],
+                    body=bytes(view[head + GEN2_HEADER_SIZE: tail_start]),
+                )
             )
-            del self._buffer[:1]
-            return None
+            head += total_len
 
-        body = bytes(buf[GEN2_HEADER_SIZE: GEN2_HEADER_SIZE + data_len])
-        del self._buffer[:total_len]
+        if head >= end:
+            # Fully drained: rewind for free instead of compacting later.
+            head = end = 0
+        self._head = head
+        self._len = end
 
-        return Gen2Packet(msg_id=msg_id, command=command, body=body)
-
-    def _find_magic(self) -> int:
-        """Return index of magic header in buffer, or -1 if not found."""
-        buf = self._buffer
-        for i in range(len(buf) - len(GEN2_MAGIC) + 1):
-            if bytes(buf[i: i + len(GEN2_MAGIC)]) == GEN2_MAGIC:
-                return i
-        return -1
+    def _compact(self) -> None:
+        """Move the unconsumed region back to the start of the buffer."""
+        size = self._len - self._head
+        self._view[:size] = self._view[self._head: self._len]
+        self._head = 0
+        self._len = size
 
     def reset(self) -> None:
         """Discard all buffered data."""
-        self._buffer.clear()
+        self._head = 0
+        self._len = 0
 
 
 # ---------------------------------------------------------------------------
 # DLReport parser
 # ---------------------------------------------------------------------------
 
-def _parse_int32_be(data: bytes, offset: int) -> int:
-    return struct.unpack_from(">i", data, offset)[0]
+# One unpack per block decodes every field in C; at one or two 34-byte blocks per
+# report this is a fraction of a microsecond, well below the fixed per-call cost
+# of an array library, so plain struct is the right tool here. The same budget
+# is why this module stays pure Python rather than a mypyc/Cython extension:
+# a whole dual-line report costs a few microseconds at roughly one report per
+# second, and HACS installs custom components as source with no build step.
+#
+# Fields common to every Gen2 model:
+#   voltage, current, power, energy, backlight, neutral, frequency, error, relay
+_DL_BLOCK_BASIC = fixed_layout((
+    (GEN2_OFF_INPUT_VOLTAGE, "i"),
+    (GEN2_OFF_CURRENT, "i"),
+    (GEN2_OFF_POWER, "i"),
+    (GEN2_OFF_ENERGY, "i"),
+    (GEN2_OFF_BACKLIGHT, "B"),
+    (GEN2_OFF_NEUTRAL_DETECT, "B"),
+    (GEN2_OFF_FREQUENCY, "i"),
+    (GEN2_OFF_ERROR_CODE, "B"),
+    (GEN2_OFF_RELAY_STATUS, "B"),
+), GEN2_DLREPORT_SINGLE_SIZE)
+
+# Enhanced models (E8/V8/E9/V9) add output voltage, boost and temperature:
+#   voltage, current, power, energy, output_voltage, backlight, neutral, boost,
+#   temperature, frequency, error, relay
+_DL_BLOCK_ENHANCED = fixed_layout((
+    (GEN2_OFF_INPUT_VOLTAGE, "i"),
+    (GEN2_OFF_CURRENT, "i"),
+    (GEN2_OFF_POWER, "i"),
+    (GEN2_OFF_ENERGY, "i"),
+    (GEN2_OFF_OUTPUT_VOLTAGE, "i"),
+    (GEN2_OFF_BACKLIGHT, "B"),
+    (GEN2_OFF_NEUTRAL_DETECT, "B"),
+    (GEN2_OFF_BOOST, "B"),
+    (GEN2_OFF_TEMPERATURE_F, "B"),
+    (GEN2_OFF_FREQUENCY, "i"),
+    (GEN2_OFF_ERROR_CODE, "B"),
+    (GEN2_OFF_RELAY_STATUS, "B"),
+), GEN2_DLREPORT_SINGLE_SIZE)
+
+
+def _dual(layout: struct.Struct) -> struct.Struct:
+    """Return a Struct that decodes two consecutive blocks of layout at once."""
+    single = layout.format.lstrip(">")
+    dual = struct.Struct(">" + single + single)
+    if dual.size != GEN2_DLREPORT_DUAL_SIZE:
+        raise ValueError(
+            f"dual layout is {dual.size} bytes, expected {GEN2_DLREPORT_DUAL_SIZE}"
+        )
+    return dual
 
 
-def parse_dl_block(block: bytes, is_enhanced: bool) -> HughesLineData:
-    """Parse one 34-byte DLReport data block into a HughesLineData."""
-    voltage = _parse_int32_be(block, GEN2_OFF_INPUT_VOLTAGE) / GEN2_SCALE_POWER
-    current = _parse_int32_be(block, GEN2_OFF_CURRENT) / GEN2_SCALE_POWER
-    power = _parse_int32_be(block, GEN2_OFF_POWER) / GEN2_SCALE_POWER
-    energy = _parse_int32_be(block, GEN2_OFF_ENERGY) / GEN2_SCALE_POWER
-    frequency = _parse_int32_be(block, GEN2_OFF_FREQUENCY) / GEN2_SCALE_FREQ
-    error_code = block[GEN2_OFF_ERROR_CODE]
-    error_text = GEN2_ERROR_CODES.get(error_code, f"Unknown ({error_code})")
-    relay_raw = block[GEN2_OFF_RELAY_STATUS]
-    relay_on = relay_raw == GEN2_RELAY_ON  # 1=ON, 2=OFF, default ON for unknown
-    neutral_detection = bool(block[GEN2_OFF_NEUTRAL_DETECT])
-    backlight = int(block[GEN2_OFF_BACKLIGHT])
+_DL_DUAL_BASIC = _dual(_DL_BLOCK_BASIC)
+_DL_DUAL_ENHANCED = _dual(_DL_BLOCK_ENHANCED)
 
+
+# Byte → bool decode tables, indexed directly by the unpacked status byte.
+# Relay: 1=ON, 2=OFF, and any unknown value defaults to ON per the protocol.
+# Flags: any non-zero byte is set.
+_RELAY_TABLE: tuple[bool, ...] = tuple(b != GEN2_RELAY_OFF for b in range(256))
+_FLAG_TABLE: tuple[bool, ...] = tuple(b != 0 for b in range(256))
+
+
+def _build_line(fields: tuple[Any, ...], is_enhanced: bool) -> HughesLineData:
+    """Build a HughesLineData from one block's already-unpacked fields."""
     output_voltage: float | None = None
     boost: bool | None = None
     temperature_f: float | None = None
 
     if is_enhanced:
-        output_voltage = _parse_int32_be(block, GEN2_OFF_OUTPUT_VOLTAGE) / GEN2_SCALE_POWER
-        boost = bool(block[GEN2_OFF_BOOST])
-        temperature_f = float(block[GEN2_OFF_TEMPERATURE_F])
+        (
+            voltage_raw, current_raw, power_raw, energy_raw, output_raw,
+            backlight, neutral_raw, boost_raw, temp_raw,
+            freq_raw, error_code, relay_raw,
+        ) = fields
+        output_voltage = output_raw / GEN2_SCALE_POWER
+        boost = _FLAG_TABLE[boost_raw]
+        temperature_f = float(temp_raw)
+    else:
+        (
+            voltage_raw, current_raw, power_raw, energy_raw,
+            backlight, neutral_raw,
+            freq_raw, error_code, relay_raw,
+        ) = fields
 
+    error_text = GEN2_ERROR_TEXTS[error_code]
+
+    # Scaled values stay unrounded; see HughesLineData.
     return HughesLineData(
-        voltage=round(voltage, 4),
-        current=round(current, 4),
-        power=round(power, 4),
-        energy=round(energy, 4),
-        frequency=round(frequency, 2),
+        voltage=voltage_raw / GEN2_SCALE_POWER,
+        current=current_raw / GEN2_SCALE_POWER,
+        power=power_raw / GEN2_SCALE_POWER,
+        energy=energy_raw / GEN2_SCALE_POWER,
+        frequency=freq_raw / GEN2_SCALE_FREQ,
         error_code=error_code,
         error_text=error_text,
-        relay_on=relay_on,
-        neutral_detection=neutral_detection,
+        relay_on=_RELAY_TABLE[relay_raw],
+        neutral_detection=_FLAG_TABLE[neutral_raw],
         backlight=backlight,
-        output_voltage=round(output_voltage, 4) if output_voltage is not None else None,
+        output_voltage=output_voltage,
         boost=boost,
         temperature_f=temperature_f,
     )
 
 
+def parse_dl_block(block: bytes, is_enhanced: bool) -> HughesLineData:
+    """Parse one 34-byte DLReport data block into a HughesLineData."""
+    layout = _DL_BLOCK_ENHANCED if is_enhanced else _DL_BLOCK_BASIC
+    return _build_line(layout.unpack_from(block), is_enhanced)
+
+
 def parse_dl_report(
     body: bytes, is_enhanced: bool
 ) -> tuple[HughesLineData, HughesLineData | None] | None:
@@ -225,8 +352,12 @@ def parse_dl_report(
         line1 = parse_dl_block(body, is_enhanced)
         return line1, None
     elif len(body) == GEN2_DLREPORT_DUAL_SIZE:
-        line1 = parse_dl_block(body[:GEN2_DLREPORT_SINGLE_SIZE], is_enhanced)
-        line2 = parse_dl_block(body[GEN2_DLREPORT_SINGLE_SIZE:], is_enhanced)
+        # Both blocks in one unpack, then split the flat tuple per line.
+        layout = _DL_DUAL_ENHANCED if is_enhanced else _DL_DUAL_BASIC
+        fields = layout.unpack_from(body)
+        n = len(fields) // 2
+        line1 = _build_line(fields[:n], is_enhanced)
+        line2 = _build_line(fields[n:], is_enhanced)
         return line1, line2
     else:
         _LOGGER.warning(
@@ -245,6 +376,9 @@ def parse_dl_report(
 class Gen2CommandBuilder:
     """Builds framed Gen2 command packets.
 
+    Holds the rolling msg_id counter for one BLE link, so each connection owns
+    its own instance rather than sharing one across devices.
+
     Usage:
         builder = Gen2CommandBuilder()
         packet_bytes = builder.set_relay(True)
@@ -252,6 +386,21 @@ class Gen2CommandBuilder:
 
     def __init__(self) -> None:
         self._msg_id = 0
+        # Fixed-shape commands are kept as ready-framed templates; building one
+        # just patches the msg_id (and single body byte) in place.
+        self._tmpl_relay = self._template(GEN2_CMD_SET_OPEN, 1)
+        self._tmpl_backlight = self._template(GEN2_CMD_SET_BACKLIGHT, 1)
+        self._tmpl_neutral = self._template(GEN2_CMD_NEUTRAL_DETECTION, 1)
+        self._tmpl_energy_reset = self._template(GEN2_CMD_ENERGY_RESET, 0)
+
+    @staticmethod
+    def _template(cmd: int, body_len: int) -> bytearray:
+        """Return a framed packet for cmd with a zeroed msg_id and body."""
+        return bytearray(
+            _HEADER.pack(GEN2_MAGIC, GEN2_PROTOCOL_VERSION, 0, cmd, body_len)
+            + bytes(body_len)
+            + GEN2_TAIL
+        )
 
     def _next_id(self) -> int:
         self._msg_id = (self._msg_id % GEN2_MSG_ID_MAX) + 1
@@ -260,35 +409,40 @@ class Gen2CommandBuilder:
     def _build(self, cmd: int, body: bytes = b"") -> bytes:
         """Build a framed Gen2 packet."""
         msg_id = self._next_id()
-        data_len = len(body)
-        header = (
-            GEN2_MAGIC
-            + bytes([GEN2_PROTOCOL_VERSION, msg_id, cmd])
-            + struct.pack(">H", data_len)
-        )
+        header = _HEADER.pack(GEN2_MAGIC, GEN2_PROTOCOL_VERSION, msg_id, cmd, len(body))
         return header + body + GEN2_TAIL
 
+    def _build_from(self, template: bytearray, value: int | None = None) -> bytes:
+        """Stamp the next msg_id (and optional 1-byte body) into a template."""
+        template[_OFF_MSG_ID] = self._next_id()
+        if value is not None:
+            template[GEN2_HEADER_SIZE] = value
+        return bytes(template)
+
     def set_relay(self, on: bool) -> bytes:
         """Build CMD_SET_OPEN packet (0x0B)."""
-        return self._build(GEN2_CMD_SET_OPEN, bytes([GEN2_RELAY_ON if on else GEN2_RELAY_OFF]))
+        return self._build_from(self._tmpl_relay, GEN2_RELAY_ON if on else GEN2_RELAY_OFF)
 
     def set_backlight(self, level: int) -> bytes:
         """Build CMD_SET_BACKLIGHT packet (0x07). level must be 0–5."""
         level = max(0, min(GEN2_BACKLIGHT_MAX, level))
-        return self._build(GEN2_CMD_SET_BACKLIGHT, bytes([level]))
+        return self._build_from(self._tmpl_backlight, level)
 
     def set_neutral_detection(self, enable: bool) -> bytes:
         """Build CMD_NEUTRAL_DETECTION packet (0x0D)."""
-        return self._build(GEN2_CMD_NEUTRAL_DETECTION, bytes([0x01 if enable else 0x00]))
+        return self._build_from(self._tmpl_neutral, 0x01 if enable else 0x00)
 
     def energy_reset(self) -> bytes:
         """Build CMD_ENERGY_RESET packet (0x03)."""
-        return self._build(GEN2_CMD_ENERGY_RESET)
+        return self._build_from(self._tmpl_energy_reset)
 
     def set_time(self, dt: datetime.datetime | None = None) -> bytes:
         """Build CMD_SET_TIME packet (0x06) using current UTC time."""
         if dt is None:
-            dt = datetime.datetime.now(datetime.timezone.utc)
-        year_offset = dt.year - 2000
-        body = bytes([year_offset, dt.month, dt.day, dt.hour, dt.minute, dt.second])
+            t = time.gmtime()
+            body = bytes([
+                t.tm_year - 2000, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec
+            ])
+        else:
+            body = bytes([dt.year - 2000, dt.month, dt.day, dt.hour, dt.minute, dt.second])
         return self._build(GEN2_CMD_SET_TIME, body)
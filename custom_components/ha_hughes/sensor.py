@@ -25,6 +25,8 @@ from __future__ import annotations
 import datetime
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -48,8 +50,15 @@ from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEVICE_NAME, DOMAIN
+from .const import (
+    AVAIL_BASIC,
+    AVAIL_DUAL_LINE,
+    AVAIL_ENHANCED,
+    CONF_DEVICE_NAME,
+    DOMAIN,
+)
 from .coordinator import HughesCoordinator
+from .entity import HughesCachedEntity
 from .models import HughesLineData, HughesState
 
 # Energy sensors report a lifetime-cumulative reading that never resets to a
@@ -63,6 +72,8 @@ from .models import HughesLineData, HughesState
 _ENERGY_LAST_RESET = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
 
 
+# No slots=True: EntityDescription is built by HA's FrozenOrThawed metaclass and
+# has no __slots__ itself, so instances keep a __dict__ regardless.
 @dataclass(frozen=True, kw_only=True)
 class HughesSensorDescription(SensorEntityDescription):
     """Describe a Hughes sensor entity."""
@@ -85,7 +96,7 @@ _L1_SENSORS: tuple[HughesSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:lightning-bolt",
         suggested_display_precision=2,
-        value_fn=lambda d: d.voltage,
+        value_fn=attrgetter("voltage"),
     ),
     HughesSensorDescription(
         key="current_l1",
@@ -95,7 +106,7 @@ _L1_SENSORS: tuple[HughesSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:current-ac",
         suggested_display_precision=2,
-        value_fn=lambda d: d.current,
+        value_fn=attrgetter("current"),
     ),
     HughesSensorDescription(
         key="power_l1",
@@ -105,7 +116,7 @@ _L1_SENSORS: tuple[HughesSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:flash",
         suggested_display_precision=1,
-        value_fn=lambda d: d.power,
+        value_fn=attrgetter("power"),
     ),
     HughesSensorDescription(
         key="energy_l1",
@@ -115,7 +126,7 @@ _L1_SENSORS: tuple[HughesSensorDescription, ...] = (
         state_class=SensorStateClass.TOTAL,
         icon="mdi:meter-electric",
         suggested_display_precision=3,
-        value_fn=lambda d: d.energy,
+        value_fn=attrgetter("energy"),
     ),
     HughesSensorDescription(
         key="frequency_l1",
@@ -125,21 +136,21 @@ _L1_SENSORS: tuple[HughesSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:sine-wave",
         suggested_display_precision=1,
-        value_fn=lambda d: d.frequency,
+        value_fn=attrgetter("frequency"),
     ),
     HughesSensorDescription(
         key="error_l1",
         name="L1 Error",
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:alert-circle-outline",
-        value_fn=lambda d: d.error_text,
+        value_fn=attrgetter("error_text"),
     ),
     HughesSensorDescription(
         key="error_code_l1",
         name="L1 Error Code",
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:numeric",
-        value_fn=lambda d: d.error_code,
+        value_fn=attrgetter("error_code"),
     ),
     # Gen2 enhanced only
     HughesSensorDescription(
@@ -151,7 +162,7 @@ _L1_SENSORS: tuple[HughesSensorDescription, ...] = (
         icon="mdi:lightning-bolt-outline",
         suggested_display_precision=2,
         gen2_enhanced_only=True,
-        value_fn=lambda d: d.output_voltage,
+        value_fn=attrgetter("output_voltage"),
     ),
     HughesSensorDescription(
         key="temperature_l1",
@@ -161,7 +172,7 @@ _L1_SENSORS: tuple[HughesSensorDescription, ...] = (
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:thermometer",
         gen2_enhanced_only=True,
-        value_fn=lambda d: d.temperature_f,
+        value_fn=attrgetter("temperature_f"),
     ),
 )
 
@@ -175,7 +186,7 @@ _L2_SENSORS: tuple[HughesSensorDescription, ...] = (
         icon="mdi:lightning-bolt",
         suggested_display_precision=2,
         is_l2=True,
-        value_fn=lambda d: d.voltage,
+        value_fn=attrgetter("voltage"),
     ),
     HughesSensorDescription(
         key="current_l2",
@@ -186,7 +197,7 @@ _L2_SENSORS: tuple[HughesSensorDescription, ...] = (
         icon="mdi:current-ac",
         suggested_display_precision=2,
         is_l2=True,
-        value_fn=lambda d: d.current,
+        value_fn=attrgetter("current"),
     ),
     HughesSensorDescription(
         key="power_l2",
@@ -197,7 +208,7 @@ _L2_SENSORS: tuple[HughesSensorDescription, ...] = (
         icon="mdi:flash",
         suggested_display_precision=1,
         is_l2=True,
-        value_fn=lambda d: d.power,
+        value_fn=attrgetter("power"),
     ),
     HughesSensorDescription(
         key="energy_l2",
@@ -208,7 +219,7 @@ _L2_SENSORS: tuple[HughesSensorDescription, ...] = (
         icon="mdi:meter-electric",
         suggested_display_precision=3,
         is_l2=True,
-        value_fn=lambda d: d.energy,
+        value_fn=attrgetter("energy"),
     ),
     HughesSensorDescription(
         key="frequency_l2",
@@ -219,7 +230,7 @@ _L2_SENSORS: tuple[HughesSensorDescription, ...] = (
         icon="mdi:sine-wave",
         suggested_display_precision=1,
         is_l2=True,
-        value_fn=lambda d: d.frequency,
+        value_fn=attrgetter("frequency"),
     ),
     HughesSensorDescription(
         key="error_l2",
@@ -227,7 +238,7 @@ _L2_SENSORS: tuple[HughesSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:alert-circle-outline",
         is_l2=True,
-        value_fn=lambda d: d.error_text,
+        value_fn=attrgetter("error_text"),
     ),
     HughesSensorDescription(
         key="error_code_l2",
@@ -235,12 +246,20 @@ _L2_SENSORS: tuple[HughesSensorDescription, ...] = (
         entity_category=EntityCategory.DIAGNOSTIC,
         icon="mdi:numeric",
         is_l2=True,
-        value_fn=lambda d: d.error_code,
+        value_fn=attrgetter("error_code"),
     ),
 )
 
 SENSOR_DESCRIPTIONS: tuple[HughesSensorDescription, ...] = _L1_SENSORS + _L2_SENSORS
 
+# Per-capability selections, resolved once at import. L2 entities stay in both:
+# dual-line is only detected once data flows, so they are gated by availability.
+# Gen1 and non-enhanced Gen2 expose the same set.
+_BASIC_DESCRIPTIONS: tuple[HughesSensorDescription, ...] = tuple(
+    desc for desc in SENSOR_DESCRIPTIONS if not desc.gen2_enhanced_only
+)
+_ENHANCED_DESCRIPTIONS: tuple[HughesSensorDescription, ...] = SENSOR_DESCRIPTIONS
+
 
 # ---------------------------------------------------------------------------
 # Cumulative (L1 + L2) sensor definitions — 50amp / dual-line units only
@@ -257,7 +276,13 @@ _CUMULATIVE_SENSORS: tuple[tuple[str, str], ...] = (
 # Platform setup
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=64)
 def _make_device_info(address: str, device_name: str) -> DeviceInfo:
+    """Return the DeviceInfo shared by every entity of one device.
+
+    Memoised so all platforms hand HA the same object; callers must treat the
+    returned dict as read-only.
+    """
     display_name = (
         f"Power Watchdog {device_name}" if device_name else f"Power Watchdog {address}"
     )
@@ -277,19 +302,21 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hughes sensor entities from a config entry."""
     coordinator: HughesCoordinator = hass.data[DOMAIN][entry.entry_id]
-    address = entry.data[CONF_ADDRESS]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "")
+    device_info = _make_device_info(
+        entry.data[CONF_ADDRESS], entry.data.get(CONF_DEVICE_NAME, "")
+    )
 
     entities: list[SensorEntity] = [
-        HughesSensor(coordinator, address, device_name, desc)
-        for desc in SENSOR_DESCRIPTIONS
-        if not desc.gen2_enhanced_only or coordinator.is_enhanced
+        HughesSensor(coordinator, device_info, desc)
+        for desc in (
+            _ENHANCED_DESCRIPTIONS if coordinator.is_enhanced else _BASIC_DESCRIPTIONS
+        )
     ]
     entities += [
-        HughesCumulativeSensor(coordinator, address, device_name, key, name)
+        HughesCumulativeSensor(coordinator, device_info, key, name)
         for key, name in _CUMULATIVE_SENSORS
     ]
-    entities += [HughesRSSISensor(coordinator, address, device_name)]
+    entities += [HughesRSSISensor(coordinator, device_info)]
     async_add_entities(entities)
 
 
@@ -297,7 +324,7 @@ async def async_setup_entry(
 # Entity classes
 # ---------------------------------------------------------------------------
 
-class HughesSensor(CoordinatorEntity[HughesCoordinator], SensorEntity):
+class HughesSensor(HughesCachedEntity, SensorEntity):
     """A Hughes Power Watchdog sensor entity."""
 
     entity_description: HughesSensorDescription
@@ -306,16 +333,19 @@ class HughesSensor(CoordinatorEntity[HughesCoordinator], SensorEntity):
     def __init__(
         self,
         coordinator: HughesCoordinator,
-        address: str,
-        device_name: str,
+        device_info: DeviceInfo,
         description: HughesSensorDescription,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        self._address = address
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_{description.key}"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + description.key
+        self._attr_device_info = device_info
+        required = AVAIL_BASIC
+        if description.gen2_enhanced_only:
+            required |= AVAIL_ENHANCED
+        if description.is_l2:
+            required |= AVAIL_DUAL_LINE
+        self._required = required
         self._last_energy: float | None = None
 
     @property
@@ -327,58 +357,41 @@ class HughesSensor(CoordinatorEntity[HughesCoordinator], SensorEntity):
 
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Skip state writes for energy sensors when the value has not changed.
+        """Refresh cached attributes; skip energy writes when the value has not changed.
 
         The coordinator fires on every BLE notification (~2/s for dual-line Gen1).
         Suppressing duplicate energy writes keeps recorder churn down without
         affecting statistics: a genuine change (including a decrease, which TOTAL
         records as a signed delta) still writes through.
         """
+        self._refresh_attrs()
         if self.entity_description.device_class == SensorDeviceClass.ENERGY:
-            if not self.available:
+            if not self._attr_available:
                 self._last_energy = None  # reset so next available write always fires
             else:
-                state = self.coordinator.state
-                new_val: float | None = None
-                if state is not None:
-                    line = self._get_line_data(state)
-                    if line is not None:
-                        v = self.entity_description.value_fn(line)
-                        if isinstance(v, (int, float)):
-                            new_val = float(v)
+                v = self._attr_native_value
+                new_val = float(v) if isinstance(v, (int, float)) else None
                 if new_val is not None and new_val == self._last_energy:
                     return
                 self._last_energy = new_val
         self.async_write_ha_state()
 
-    def _get_line_data(self, state: HughesState) -> HughesLineData | None:
-        """Return the appropriate line data for this entity."""
-        if self.entity_description.is_l2:
-            return state.line2
-        return state.line1
-
-    @property
-    def available(self) -> bool:
-        """Available when connected and the required data is present."""
-        if not self.coordinator.connected or self.coordinator.state is None:
-            return False
+    def _compute_native_value(self) -> float | int | str | None:
+        """Return this entity's value from the selected line, if present."""
         state = self.coordinator.state
-        if self.entity_description.gen2_enhanced_only and not state.is_enhanced:
-            return False
-        if self.entity_description.is_l2 and not state.is_dual_line:
-            return False
-        return True
-
-    @property
-    def native_value(self) -> float | int | str | None:
-        """Return the sensor value."""
-        if self.coordinator.state is None:
+        if state is None:
             return None
-        line = self._get_line_data(self.coordinator.state)
+        line = self._get_line_data(state)
         if line is None:
             return None
         return self.entity_description.value_fn(line)
 
+    def _get_line_data(self, state: HughesState) -> HughesLineData | None:
+        """Return the appropriate line data for this entity."""
+        if self.entity_description.is_l2:
+            return state.line2
+        return state.line1
+
 
 # ---------------------------------------------------------------------------
 # Cumulative (L1 + L2) sensor — dual-line units only
@@ -404,6 +417,9 @@ _CUMULATIVE_META: dict[str, tuple] = {
 }
 
 
+_DUAL_REQUIRED = AVAIL_BASIC | AVAIL_DUAL_LINE
+
+
 class HughesCumulativeSensor(CoordinatorEntity[HughesCoordinator], SensorEntity):
     """L1 + L2 cumulative sensor — only present and available on dual-line (50amp) units."""
 
@@ -412,17 +428,15 @@ class HughesCumulativeSensor(CoordinatorEntity[HughesCoordinator], SensorEntity)
     def __init__(
         self,
         coordinator: HughesCoordinator,
-        address: str,
-        device_name: str,
+        device_info: DeviceInfo,
         key: str,
         name: str,
     ) -> None:
         super().__init__(coordinator)
         self._key = key
         self._attr_name = name
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_{key}"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + key
+        self._attr_device_info = device_info
         meta = _CUMULATIVE_META[key]
         self._attr_native_unit_of_measurement = meta[0]
         self._attr_device_class = meta[1]
@@ -456,10 +470,7 @@ class HughesCumulativeSensor(CoordinatorEntity[HughesCoordinator], SensorEntity)
     @property
     def available(self) -> bool:
         """Only available when connected and dual-line data is present."""
-        if not self.coordinator.connected or self.coordinator.state is None:
-            return False
-        state = self.coordinator.state
-        return state.is_dual_line and state.line2 is not None
+        return (self.coordinator.availability & _DUAL_REQUIRED) == _DUAL_REQUIRED
 
     @property
     def native_value(self) -> float | None:
@@ -493,13 +504,11 @@ class HughesRSSISensor(CoordinatorEntity[HughesCoordinator], SensorEntity):
     def __init__(
         self,
         coordinator: HughesCoordinator,
-        address: str,
-        device_name: str,
+        device_info: DeviceInfo,
     ) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_rssi"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + "rssi"
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
@@ -15,10 +15,11 @@ from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ADDRESS, EntityCategory
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_DEVICE_NAME, DOMAIN
+from .const import AVAIL_BASIC, CONF_DEVICE_NAME, DOMAIN
 from .coordinator import HughesCoordinator
 from .sensor import _make_device_info
 
@@ -32,12 +33,13 @@ async def async_setup_entry(
 ) -> None:
     """Set up Hughes switch entities from a config entry."""
     coordinator: HughesCoordinator = hass.data[DOMAIN][entry.entry_id]
-    address = entry.data[CONF_ADDRESS]
-    device_name = entry.data.get(CONF_DEVICE_NAME, "")
+    device_info = _make_device_info(
+        entry.data[CONF_ADDRESS], entry.data.get(CONF_DEVICE_NAME, "")
+    )
 
     async_add_entities([
-        HughesRelaySwitch(coordinator, address, device_name),
-        HughesNeutralDetectionSwitch(coordinator, address, device_name),
+        HughesRelaySwitch(coordinator, device_info),
+        HughesNeutralDetectionSwitch(coordinator, device_info),
     ])
 
 
@@ -53,17 +55,16 @@ class HughesRelaySwitch(CoordinatorEntity[HughesCoordinator], SwitchEntity):
     _attr_icon = "mdi:power-socket"
 
     def __init__(
-        self, coordinator: HughesCoordinator, address: str, device_name: str
+        self, coordinator: HughesCoordinator, device_info: DeviceInfo
     ) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_relay"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + "relay"
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
         """Available when connected and we have at least one DLReport."""
-        return self.coordinator.connected and self.coordinator.state is not None
+        return (self.coordinator.availability & AVAIL_BASIC) == AVAIL_BASIC
 
     @property
     def is_on(self) -> bool | None:
@@ -96,17 +97,16 @@ class HughesNeutralDetectionSwitch(CoordinatorEntity[HughesCoordinator], SwitchE
     _attr_icon = "mdi:electric-switch"
 
     def __init__(
-        self, coordinator: HughesCoordinator, address: str, device_name: str
+        self, coordinator: HughesCoordinator, device_info: DeviceInfo
     ) -> None:
         super().__init__(coordinator)
-        mac = address.replace(":", "").lower()
-        self._attr_unique_id = f"{mac}_neutral_detection"
-        self._attr_device_info = _make_device_info(address, device_name)
+        self._attr_unique_id = coordinator.uid_prefix + "neutral_detection"
+        self._attr_device_info = device_info
 
     @property
     def available(self) -> bool:
         """Available when connected and we have state."""
-        return self.coordinator.connected and self.coordinator.state is not None
+        return (self.coordinator.availability & AVAIL_BASIC) == AVAIL_BASIC
 
     @property
     def is_on(self) -> bool | None: